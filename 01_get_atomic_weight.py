@@ -1,51 +1,62 @@
 import json
-from mendeleev import element
+
+def save_python_module(mass_dict, filename='_element_masses.py'):
+    """
+    将数据同时写成纯 Python 字面量模块，GUI 直接 import 即可，
+    由 .pyc 缓存跳过 JSON 解析。
+    """
+    lines = [
+        "# Auto-generated by 01_get_atomic_weight.py. Do not edit by hand.",
+        "ELEMENT_MOLAR_MASS = {",
+    ]
+    for symbol, mass in mass_dict.items():
+        lines.append(f"    {symbol!r}: {mass!r},")
+    lines.append("}")
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
 
 def generate_and_save_data():
-    mass_dict = {}
-    
+    # mendeleev（SQLAlchemy + SQLite）导入较慢，仅在真正生成数据时才导入
+    from mendeleev.fetch import fetch_table
+
     print("正在从 mendeleev 库获取数据...")
     
-    # 遍历原子序数 1 到 118
-    for z in range(1, 119):
-        try:
-            el = element(z)
-            symbol = el.symbol
-            mass = el.mass
-            
-            # 数据处理逻辑：确保获取到一个有效的浮点数
-            valid_mass = None
-            
-            if mass is not None:
-                # 检查是否为区间
-                if hasattr(mass, '__iter__') and not isinstance(mass, str):
-                    valid_mass = float(mass[0]) if len(mass) > 0 else float(el.mass_number)
-                else:
-                    valid_mass = float(mass)
-            else:
-                # 回退到 mass_number
-                if el.mass_number is not None:
-                    valid_mass = float(el.mass_number)
-                else:
-                    valid_mass = 0.0
-            
-            # 存入字典
-            # 注意：这里我们直接存 float 类型，方便后续计算
-            # 没必要存保留小数位的字符串，那样在使用时还需要再转回 float
-            mass_dict[symbol] = valid_mass
-            
-        except Exception as e:
-            print(f"Error processing element Z={z}: {e}")
-            continue
+    # 一次 SQL 查询取回全部元素（原子序数 1 到 118），避免逐个 element(z) 访问数据库
+    df = fetch_table('elements')
+    df = df[df['atomic_number'].between(1, 118)].sort_values('atomic_number')
+    
+    # 数据处理逻辑：确保获取到一个有效的浮点数
+    # elements 表没有 mass_number 列（element(z).mass_number 由同位素计算得出），
+    # 因此 atomic_weight 缺失时，从 isotopes 表取丰度最高同位素的质量数作为回退，
+    # 两者都缺失则记为 0.0
+    weights = df['atomic_weight'].astype(float)
+    missing = weights.isna()
+    if missing.any():
+        isotopes = fetch_table('isotopes')
+        isotopes = isotopes.assign(abundance=isotopes['abundance'].fillna(0.0))
+        top = isotopes.loc[isotopes.groupby('atomic_number')['abundance'].idxmax()]
+        top_mass_number = top.set_index('atomic_number')['mass_number']
+        fallback = df['atomic_number'].map(top_mass_number).astype(float)
+        weights = weights.where(~missing, fallback)
+    masses = weights.fillna(0.0).tolist()
+    
+    # 存入字典
+    # 注意：这里我们直接存 float 类型，方便后续计算
+    # 没必要存保留小数位的字符串，那样在使用时还需要再转回 float
+    mass_dict = dict(zip(df['symbol'], masses))
 
     # 将字典写入 JSON 文件
+    filename = '01_element_atomic-masses.json'
     # ensure_ascii=False 保证非英文字符（虽然元素符号都是英文，但这是好习惯）能正常显示
     # indent=4 让生成的文件具有良好的缩进格式，方便人类阅读
-    filename = '01_element_atomic-masses.json'
     with open(filename, 'w', encoding='utf-8') as f:
         json.dump(mass_dict, f, ensure_ascii=False, indent=4)
         
     print(f"数据已成功保存到 {filename}")
 
+    module_name = '_element_masses.py'
+    save_python_module(mass_dict, module_name)
+    print(f"数据已成功保存到 {module_name}")
+
 if __name__ == "__main__":
     generate_and_save_data()
\ No newline at end of file
@@ -1,125 +1,67 @@
-import sys
-import json
-import os
-import re
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter.font import Font
 
+from core import wt_to_at, at_to_wt, parse_composition_input
+
 # ==========================================
-# 1. Core Logic
+# Modern GUI Class
 # ==========================================
 
-def resource_path(relative_path):
-    """
-    Get the absolute path to a resource.
-    This function handles paths for both the development environment 
-    and the PyInstaller bundled executable.
-    """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except AttributeError:
-        # If not running in a bundle (running as .py), use current directory
-        base_path = os.path.abspath(".")
+# Result table formatters (bound once, reused for every row)
+_HEADER_FMT = "{:<10} | {:<15} | {:<15}".format
+_ROW_FMT = "{:<10} | {:<15.4f} | {:<15.4f}".format
 
-    return os.path.join(base_path, relative_path)
+# Tk interpreter whose ttk styles are already configured
+_STYLES_INITIALIZED_FOR = None
 
-def get_element_atomic_masses():
-    """
-    Load element atomic masses from a JSON file.
-    Includes a fallback dictionary if the file is missing.
-    """
-    # Use resource_path to locate the JSON file
-    filename = resource_path('01_element_atomic-masses.json')
-    
-    # Debug code (optional): Print path to verify if needed
-    # print(f"Looking for file at: {filename}") 
+# Window background color
+_BG_COLOR = "#ffffff"
 
-    if not os.path.exists(filename):
-        # Fallback dictionary if JSON is not found (e.g., if forgotten during packaging)
-        # Data covers H to Zn
-        return {
-            "H": 1.008, "He": 4.0026, "Li": 6.94, "Be": 9.0122, "B": 10.81, 
-            "C": 12.011, "N": 14.007, "O": 15.999, "F": 18.998, "Ne": 20.180, 
-            "Na": 22.990, "Mg": 24.305, "Al": 26.982, "Si": 28.085, "P": 30.974, 
-            "S": 32.06, "Cl": 35.45, "Ar": 39.948, "K": 39.098, "Ca": 40.078, 
-            "Sc": 44.956, "Ti": 47.867, "V": 50.942, "Cr": 51.996, "Mn": 54.938, 
-            "Fe": 55.845, "Co": 58.933, "Ni": 58.693, "Cu": 63.546, "Zn": 65.38
-        }
-    
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        raise IOError(f"Error reading data file: {e}")
-
-# Initialize global data constant
-ELEMENT_MOLAR_MASS = get_element_atomic_masses()
-
-def check_input_composition(comp_dict, mode='wt'):
+def _init_styles_once(root):
     """
-    Ensure the input composition sums to 100% (with a small tolerance).
+    Configure modern styles using ttk.Style, once per Tk interpreter.
+    Styles live in the interpreter, so creating another app on the same
+    root skips all configure/map calls.
     """
-    total = sum(comp_dict.values())
-    if not (abs(total-100) <= 0.01):
-        raise ValueError(f"Sum is {total:.4f}, not equal to 100%. Please check your input.")
-
-def wt_to_at(wt_dict):
-    """Convert Weight Percent (Wt%) to Atomic Percent (At%)"""
-    check_input_composition(wt_dict, 'wt')
-    molar_amounts = {}
-    for element, wt_percent in wt_dict.items():
-        if element not in ELEMENT_MOLAR_MASS:
-            raise ValueError(f"Element '{element}' is missing from the database.")
-        molar_amounts[element] = wt_percent / ELEMENT_MOLAR_MASS[element]
-    
-    total_moles = sum(molar_amounts.values())
-    at_dict = {elem: (val / total_moles) * 100 for elem, val in molar_amounts.items()}
-    return at_dict
-
-def at_to_wt(at_dict):
-    """Convert Atomic Percent (At%) to Weight Percent (Wt%)"""
-    check_input_composition(at_dict, 'at')
-    masses = {}
-    for element, at_percent in at_dict.items():
-        if element not in ELEMENT_MOLAR_MASS:
-            raise ValueError(f"Element '{element}' is missing from the database.")
-        masses[element] = at_percent * ELEMENT_MOLAR_MASS[element]
-    
-    total_mass = sum(masses.values())
-    wt_dict = {elem: (val / total_mass) * 100 for elem, val in masses.items()}
-    return wt_dict
+    global _STYLES_INITIALIZED_FOR
+    if _STYLES_INITIALIZED_FOR is root.tk:
+        return
 
-def parse_composition_input(user_str):
-    """
-    Parse the input string with flexible error handling.
-    Accepts formats like 'Fe:50, C:50' or direct dicts.
-    """
+    style = ttk.Style(root)
+    # Use 'clam' as a cross-platform base for custom coloring 
+    # (works better than default on Windows/Mac)
     try:
-        clean_str = user_str.strip()
-        # Allow Python dict format
-        if clean_str.startswith("{") and clean_str.endswith("}"):
-            result = eval(clean_str)
-            if isinstance(result, dict):
-                return result
+        style.theme_use('clam') 
     except:
         pass
+
+    # Define Colors
+    bg_color = _BG_COLOR
+    select_bg = "#3498db"
+    accent_color = "#2980b9" # Dark Blue
+    secondary_color = "#95a5a6" # Grey
+    text_color = "#2c3e50"
+
+    # Style configurations
+    style.configure("TFrame", background=bg_color)
+    style.configure("TLabelframe", background=bg_color, bordercolor="#bdc3c7", borderwidth=1)
+    style.configure("TLabelframe.Label", background=bg_color, foreground=select_bg, font=("Segoe UI", 10, "bold"))
+    style.configure("TLabel", background=bg_color, foreground=text_color, font=("Segoe UI", 10))
+    style.configure("TRadiobutton", background=bg_color, foreground=text_color, font=("Segoe UI", 10))
     
-    # Allow formats like Element:50 or Element = 50
-    pattern = r"['\"]?([A-Za-z][a-z]?)['\"]?\s*[:=]\s*(\d+\.?\d*)"
-    matches = re.findall(pattern, user_str)
-    if not matches:
-        raise ValueError("Unrecognized format. Please use format like: Fe:50, C:50")
-    
-    comp_dict = {}
-    for elem, val in matches:
-        comp_dict[elem] = float(val)
-    return comp_dict
+    # Buttons
+    # Accent Button (Primary action)
+    style.configure("Accent.TButton", font=("Segoe UI", 10, "bold"), background=accent_color, foreground="white", 
+                    borderwidth=0, focuscolor="none", padding=10)
+    style.map("Accent.TButton", background=[("active", "#1c5980")])
 
-# ==========================================
-# 2. Modern GUI Class
-# ==========================================
+    # Secondary Button
+    style.configure("Secondary.TButton", font=("Segoe UI", 10), background=secondary_color, foreground="white", 
+                    borderwidth=0, focuscolor="none", padding=10)
+    style.map("Secondary.TButton", background=[("active", "#7f8c8d")])
+
+    _STYLES_INITIALIZED_FOR = root.tk
 
 class CompositionApp:
     def __init__(self, root):
@@ -135,6 +77,9 @@ class CompositionApp:
         # Main container
         main_frame = ttk.Frame(root, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
+        # Lay out sections with grid; the results row takes the remaining space
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(4, weight=1)
 
         # --- Header / Title ---
         header_label = ttk.Label(
@@ -143,26 +88,30 @@ class CompositionApp:
             font=("Segoe UI", 16, "bold"),
             foreground="#2c3e50"
         )
-        header_label.pack(pady=(0, 15), anchor="center")
+        header_label.grid(row=0, column=0, pady=(0, 15))
 
         # --- Mode Selection ---
         mode_frame = ttk.LabelFrame(main_frame, text="Conversion Mode", padding="10")
-        mode_frame.pack(fill=tk.X, pady=(0, 15))
+        mode_frame.grid(row=1, column=0, sticky="ew", pady=(0, 15))
         
         self.mode_var = tk.StringVar(value="1")
-        radio_frame = ttk.Frame(mode_frame)
-        radio_frame.pack(fill=tk.X)
+        # Active conversion, switched by the radio buttons
+        self._convert_fn = wt_to_at
+        self._origin_label = "Wt.%"
+        self._result_label = "At.%"
         
         # Radio buttons for Wt% -> At% and At% -> Wt%
-        rb1 = ttk.Radiobutton(radio_frame, text="Wt.% -> At.%", variable=self.mode_var, value="1")
+        rb1 = ttk.Radiobutton(mode_frame, text="Wt.% -> At.%", variable=self.mode_var, value="1",
+                              command=lambda: self._set_mode(wt_to_at, "Wt.%", "At.%"))
         rb1.pack(side=tk.LEFT, padx=20)
         
-        rb2 = ttk.Radiobutton(radio_frame, text="At.% -> Wt.%", variable=self.mode_var, value="2")
+        rb2 = ttk.Radiobutton(mode_frame, text="At.% -> Wt.%", variable=self.mode_var, value="2",
+                              command=lambda: self._set_mode(at_to_wt, "At.%", "Wt.%"))
         rb2.pack(side=tk.LEFT, padx=20)
 
         # --- Input Area (Reduced size) ---
         input_frame = ttk.LabelFrame(main_frame, text="Input Data (e.g., Fe:98.0, C:2.0)", padding="10")
-        input_frame.pack(fill=tk.X, pady=(0, 15))
+        input_frame.grid(row=2, column=0, sticky="ew", pady=(0, 15))
 
         # Reduced height to 6 lines
         self.input_text = tk.Text(input_frame, height=6, font=self.text_font, 
@@ -172,7 +121,7 @@ class CompositionApp:
 
         # --- Buttons ---
         btn_frame = ttk.Frame(main_frame)
-        btn_frame.pack(fill=tk.X, pady=(0, 10))
+        btn_frame.grid(row=3, column=0, sticky="ew", pady=(0, 10))
         
         # Convert Button
         convert_btn = ttk.Button(btn_frame, text="Convert", style="Accent.TButton", command=self.on_convert)
@@ -184,24 +133,22 @@ class CompositionApp:
 
         # --- Output Area (Increased size with Scrollbar) ---
         output_frame = ttk.LabelFrame(main_frame, text="Results", padding="10")
-        output_frame.pack(fill=tk.BOTH, expand=True) # Expand to fill remaining space
-        
-        # Create a container for the text widget and scrollbar
-        text_container = ttk.Frame(output_frame)
-        text_container.pack(fill=tk.BOTH, expand=True)
+        output_frame.grid(row=4, column=0, sticky="nsew") # Expand to fill remaining space
 
         # Scrollbar
-        scrollbar = ttk.Scrollbar(text_container, orient="vertical")
+        scrollbar = ttk.Scrollbar(output_frame, orient="vertical")
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Result Text Area
         self.result_text = tk.Text(
-            text_container, 
+            output_frame, 
             font=self.text_font, 
             bg="#f8f9fa", 
             fg="#2c3e50", 
             bd=0, 
             state=tk.DISABLED,
+            undo=False,
+            wrap="none",
             yscrollcommand=scrollbar.set,
             padx=5, pady=5
         )
@@ -243,40 +190,14 @@ class CompositionApp:
 
     def setup_styles(self):
         """Configure modern styles using ttk.Style"""
-        style = ttk.Style()
-        # Use 'clam' as a cross-platform base for custom coloring 
-        # (works better than default on Windows/Mac)
-        try:
-            style.theme_use('clam') 
-        except:
-            pass
+        _init_styles_once(self.root)
+        self.root.configure(background=_BG_COLOR)
 
-        # Define Colors
-        bg_color = "#ffffff"
-        select_bg = "#3498db"
-        accent_color = "#2980b9" # Dark Blue
-        secondary_color = "#95a5a6" # Grey
-        text_color = "#2c3e50"
-
-        # Style configurations
-        style.configure("TFrame", background=bg_color)
-        style.configure("TLabelframe", background=bg_color, bordercolor="#bdc3c7", borderwidth=1)
-        style.configure("TLabelframe.Label", background=bg_color, foreground=select_bg, font=("Segoe UI", 10, "bold"))
-        style.configure("TLabel", background=bg_color, foreground=text_color, font=("Segoe UI", 10))
-        style.configure("TRadiobutton", background=bg_color, foreground=text_color, font=("Segoe UI", 10))
-        
-        # Buttons
-        # Accent Button (Primary action)
-        style.configure("Accent.TButton", font=("Segoe UI", 10, "bold"), background=accent_color, foreground="white", 
-                        borderwidth=0, focuscolor="none", padding=10)
-        style.map("Accent.TButton", background=[("active", "#1c5980")])
-
-        # Secondary Button
-        style.configure("Secondary.TButton", font=("Segoe UI", 10), background=secondary_color, foreground="white", 
-                        borderwidth=0, focuscolor="none", padding=10)
-        style.map("Secondary.TButton", background=[("active", "#7f8c8d")])
-
-        self.root.configure(background=bg_color)
+    def _set_mode(self, convert_fn, origin_label, result_label):
+        """Stores the conversion function and table labels for the selected mode"""
+        self._convert_fn = convert_fn
+        self._origin_label = origin_label
+        self._result_label = result_label
 
     def on_clear(self):
         """Clears input and output fields"""
@@ -288,7 +209,6 @@ class CompositionApp:
     def on_convert(self):
         """Handles the conversion logic triggered by the button"""
         raw_input = self.input_text.get(1.0, tk.END).strip()
-        mode = self.mode_var.get()
         
         if not raw_input:
             messagebox.showwarning("Input Error", "Please enter composition data.")
@@ -298,25 +218,18 @@ class CompositionApp:
             # Parse user input into a dictionary
             comp_dict = parse_composition_input(raw_input)
             
-            # Choose conversion direction
-            if mode == "1":
-                result_dict = wt_to_at(comp_dict)
-                origin_label = "Wt.%"
-                result_label = "At.%"
-            else:
-                result_dict = at_to_wt(comp_dict)
-                origin_label = "At.%"
-                result_label = "Wt.%"
+            # Convert in the direction selected by the radio buttons
+            result_dict = self._convert_fn(comp_dict)
 
             # Format output
-            output_lines = []
-            output_lines.append(f"{'Element':<10} | {origin_label:<15} | {result_label:<15}")
-            output_lines.append("-" * 45)
-            
-            for elem in comp_dict.keys():
-                val_orig = comp_dict[elem]
-                val_conv = result_dict.get(elem, 0.0)
-                output_lines.append(f"{elem:<10} | {val_orig:<15.4f} | {val_conv:<15.4f}")
+            output_lines = [
+                _HEADER_FMT("Element", self._origin_label, self._result_label),
+                "-" * 45,
+            ]
+            output_lines.extend(
+                _ROW_FMT(elem, val_orig, result_dict.get(elem, 0.0))
+                for elem, val_orig in comp_dict.items()
+            )
 
             # Display result
             self.result_text.config(state=tk.NORMAL)
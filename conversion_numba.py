@@ -0,0 +1,84 @@
+"""
+Batch conversion between Wt% and At% for many compositions at once.
+
+When Numba is installed (`pip install numba`), the whole batch is converted
+by one compiled loop; otherwise by one NumPy broadcast. Both paths give the
+same results and raise the same errors.
+The GUI path in 02_GUI.py does not use this module.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional: fall back to an identity decorator
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Conversion directions accepted by convert_batch
+WT_TO_AT = 0
+AT_TO_WT = 1
+
+@njit(cache=True)
+def _convert_rows(comps, masses, mode, out):
+    """
+    Convert every row of comps into out in one compiled loop.
+    Returns the index of the first row that sums to zero, or -1.
+    """
+    n_rows, n_cols = comps.shape
+    for i in range(n_rows):
+        total = 0.0
+        for j in range(n_cols):
+            if mode == WT_TO_AT:
+                tmp = comps[i, j] / masses[j]
+            else:
+                tmp = comps[i, j] * masses[j]
+            out[i, j] = tmp
+            total += tmp
+        if total == 0.0:
+            return i
+        scale = 100.0 / total
+        for j in range(n_cols):
+            out[i, j] *= scale
+    return -1
+
+def _convert_broadcast(comps, masses, mode):
+    """NumPy fallback of _convert_rows: the whole batch in one broadcast."""
+    tmp = comps / masses if mode == WT_TO_AT else comps * masses
+    totals = tmp.sum(axis=1, keepdims=True)
+    zero_rows = np.flatnonzero(totals == 0.0)
+    if zero_rows.size:
+        return None, int(zero_rows[0])
+    return tmp * (100.0 / totals), -1
+
+def convert_batch(compositions, masses_arr, mode=WT_TO_AT):
+    """
+    Convert a batch of compositions sharing the same element order.
+
+    compositions: 2D array-like, one composition per row (Wt% or At%).
+    masses_arr:   1D array-like of molar masses aligned with the columns.
+    mode:         WT_TO_AT or AT_TO_WT.
+
+    Returns a 2D float64 array of converted compositions, one per row.
+    Raises ValueError if a row sums to zero after conversion.
+    """
+    if mode not in (WT_TO_AT, AT_TO_WT):
+        raise ValueError(f"Unknown conversion mode: {mode}")
+    comps = np.ascontiguousarray(compositions, dtype=np.float64)
+    masses = np.ascontiguousarray(masses_arr, dtype=np.float64)
+    if comps.ndim != 2 or masses.ndim != 1 or comps.shape[1] != masses.shape[0]:
+        raise ValueError("Compositions must be a 2D array with one column per molar mass.")
+
+    if HAVE_NUMBA:
+        result = np.empty_like(comps)
+        bad_row = _convert_rows(comps, masses, mode, result)
+    else:
+        result, bad_row = _convert_broadcast(comps, masses, mode)
+    if bad_row >= 0:
+        raise ValueError(f"Composition row {bad_row} sums to zero and cannot be normalized.")
+    return result
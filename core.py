@@ -0,0 +1,150 @@
+"""
+Core composition conversion logic (Wt% <-> At%).
+Has no GUI dependencies, so scripts and batch users can import it
+without loading Tk.
+"""
+import sys
+import ast
+import functools
+import os
+import re
+
+# Resource base directory, computed once at import.
+# PyInstaller creates a temp folder and stores path in _MEIPASS;
+# if not running in a bundle (running as .py), use current directory.
+_BASE = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+_JSON_PATH = os.path.join(_BASE, '01_element_atomic-masses.json')
+
+def resource_path(relative_path):
+    """
+    Get the absolute path to a resource.
+    This function handles paths for both the development environment 
+    and the PyInstaller bundled executable.
+    """
+    return os.path.join(_BASE, relative_path)
+
+@functools.lru_cache(maxsize=1)
+def get_element_atomic_masses():
+    """
+    Load element atomic masses, loaded once and cached.
+    Prefers the generated `_element_masses.py` literal module (no JSON decode),
+    then the JSON file, then a fallback dictionary if the file is missing.
+    """
+    try:
+        from _element_masses import ELEMENT_MOLAR_MASS as masses
+        return dict(masses)
+    except ImportError:
+        pass
+
+    filename = _JSON_PATH
+    
+    # Debug code (optional): Print path to verify if needed
+    # print(f"Looking for file at: {filename}") 
+
+    if not os.path.exists(filename):
+        # Fallback dictionary if JSON is not found (e.g., if forgotten during packaging)
+        # Data covers H to Zn
+        return {
+            "H": 1.008, "He": 4.0026, "Li": 6.94, "Be": 9.0122, "B": 10.81, 
+            "C": 12.011, "N": 14.007, "O": 15.999, "F": 18.998, "Ne": 20.180, 
+            "Na": 22.990, "Mg": 24.305, "Al": 26.982, "Si": 28.085, "P": 30.974, 
+            "S": 32.06, "Cl": 35.45, "Ar": 39.948, "K": 39.098, "Ca": 40.078, 
+            "Sc": 44.956, "Ti": 47.867, "V": 50.942, "Cr": 51.996, "Mn": 54.938, 
+            "Fe": 55.845, "Co": 58.933, "Ni": 58.693, "Cu": 63.546, "Zn": 65.38
+        }
+    
+    # Only this fallback path needs a JSON decoder; prefer orjson if installed
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    try:
+        if orjson is not None:
+            with open(filename, 'rb') as f:
+                return orjson.loads(f.read())
+        import json
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        raise IOError(f"Error reading data file: {e}")
+
+# Composition pattern, e.g. Element:50 or Element = 50 (compiled once)
+_COMP_RE = re.compile(r"['\"]?([A-Za-z][a-z]?)['\"]?\s*[:=]\s*(\d+\.?\d*)")
+
+# Initialize global data constant
+ELEMENT_MOLAR_MASS = get_element_atomic_masses()
+
+def _check_total(total):
+    """
+    Ensure the input composition sums to 100% (with a small tolerance).
+    """
+    if not (abs(total-100) <= 0.01):
+        raise ValueError(f"Sum is {total:.4f}, not equal to 100%. Please check your input.")
+
+def wt_to_at(wt_dict):
+    """Convert Weight Percent (Wt%) to Atomic Percent (At%)"""
+    # Validate the sum and accumulate molar amounts in a single pass
+    total = 0.0
+    total_moles = 0.0
+    molar_amounts = {}
+    for element, wt_percent in wt_dict.items():
+        if element not in ELEMENT_MOLAR_MASS:
+            raise ValueError(f"Element '{element}' is missing from the database.")
+        moles = wt_percent / ELEMENT_MOLAR_MASS[element]
+        molar_amounts[element] = moles
+        total += wt_percent
+        total_moles += moles
+    _check_total(total)
+
+    scale = 100.0 / total_moles
+    return {elem: val * scale for elem, val in molar_amounts.items()}
+
+def at_to_wt(at_dict):
+    """Convert Atomic Percent (At%) to Weight Percent (Wt%)"""
+    # Validate the sum and accumulate masses in a single pass
+    total = 0.0
+    total_mass = 0.0
+    masses = {}
+    for element, at_percent in at_dict.items():
+        if element not in ELEMENT_MOLAR_MASS:
+            raise ValueError(f"Element '{element}' is missing from the database.")
+        mass = at_percent * ELEMENT_MOLAR_MASS[element]
+        masses[element] = mass
+        total += at_percent
+        total_mass += mass
+    _check_total(total)
+
+    scale = 100.0 / total_mass
+    return {elem: val * scale for elem, val in masses.items()}
+
+@functools.lru_cache(maxsize=32)
+def _parse_cached(user_str):
+    """
+    Parse the input string into a tuple of (element, value) pairs.
+    Cached, so re-converting unchanged input skips the literal/regex scan.
+    """
+    try:
+        clean_str = user_str.strip()
+        # Allow Python dict format
+        if clean_str.startswith("{") and clean_str.endswith("}"):
+            # literal_eval only accepts literals, never executes code
+            result = ast.literal_eval(clean_str)
+            if isinstance(result, dict):
+                return tuple(result.items())
+    except Exception:
+        pass
+    
+    # Allow formats like Element:50 or Element = 50
+    comp_dict = {sys.intern(elem): float(val) for elem, val in _COMP_RE.findall(user_str)}
+    if not comp_dict:
+        raise ValueError("Unrecognized format. Please use format like: Fe:50, C:50")
+    return tuple(comp_dict.items())
+
+def parse_composition_input(user_str):
+    """
+    Parse the input string with flexible error handling.
+    Accepts formats like 'Fe:50, C:50' or direct dicts.
+    Works on strings, so it is not Numba-jittable; batch callers should parse
+    first and pass NumPy arrays to conversion_numba.convert_batch.
+    """
+    return dict(_parse_cached(user_str))